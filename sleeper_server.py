@@ -5,9 +5,19 @@ Sleeper Fantasy Football MCP Server - Access Sleeper API for fantasy football le
 
 import os
 import sys
+import time
+import asyncio
+import fnmatch
 import logging
-import json
+import sqlite3
+import tempfile
+from pathlib import Path
+from collections import defaultdict
+from functools import wraps
+from contextlib import asynccontextmanager
+from urllib.parse import urlencode
 import httpx
+import orjson
 from mcp.server.fastmcp import FastMCP
 
 # Configure logging to stderr
@@ -18,61 +28,479 @@ logging.basicConfig(
 )
 logger = logging.getLogger("sleeper-server")
 
-# Initialize MCP server
-mcp = FastMCP("sleeper")
-
 # Configuration
 BASE_URL = "https://api.sleeper.app/v1"
-LEAGUE_ID = os.environ.get("SLEEPER_LEAGUE_ID", "")
+LEAGUE_ID = os.environ.get("SLEEPER_LEAGUE_ID", "").strip()
+TREND_TYPES = frozenset(("add", "drop"))
+
+# Shared HTTP client - keeps connections alive across tool calls and sessions.
+# Closed once at process exit by close_client, not in the per-session lifespan.
+_CLIENT = httpx.AsyncClient(
+    base_url=BASE_URL,
+    http2=True,
+    timeout=10,
+    limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+    headers={"Accept-Encoding": "gzip, br"},
+)
+_encoding_logged = False
+
+
+@asynccontextmanager
+async def lifespan(server):
+    """Warm the response cache when a session starts and stop the warmup when it ends."""
+    warmup = asyncio.create_task(warm_cache()) if LEAGUE_ID else None
+    try:
+        yield
+    finally:
+        if warmup:
+            warmup.cancel()
+            await asyncio.gather(warmup, return_exceptions=True)
+
+
+async def close_client():
+    """Cancel shared fetches still in flight and close the shared HTTP client."""
+    pending = list(_INFLIGHT.values())
+    for task in pending:
+        task.cancel()
+    await asyncio.gather(*pending, return_exceptions=True)
+    await _CLIENT.aclose()
+
+
+async def serve():
+    """Run the server over stdio and close the shared HTTP client when it stops."""
+    try:
+        await mcp.run_stdio_async()
+    finally:
+        await close_client()
+
+
+# Response cache TTLs in seconds - first matching path pattern wins
+CACHE_TTLS = {
+    "/players/nfl": 0,  # kept on disk by players_db instead
+    "/players/nfl/trending/*": 300,
+    "/state/nfl": 300,
+    "/league/*/rosters": 30,
+    "/league/*/matchups/*": 15,
+    "/league/*/transactions/*": 30,
+    "/draft/*/picks": 30,
+}
+DEFAULT_CACHE_TTL = 60
+
+# path -> (expires_at, data)
+_CACHE = {}
+# path -> task for an API request already in flight
+_INFLIGHT = {}
+
+# On-disk copy of the NFL player database keyed by player ID - Sleeper asks for at most one fetch per day
+PLAYERS_CACHE_PATH = Path(tempfile.gettempdir()) / "sleeper_players_nfl.sqlite3"
+PLAYERS_CACHE_TTL = 86400
+PLAYER_FIELDS = (
+    "first_name",
+    "last_name",
+    "position",
+    "team",
+    "number",
+    "status",
+    "age",
+    "height",
+    "weight",
+    "college",
+    "years_exp",
+    "fantasy_positions",
+    "injury_status",
+)
+
+_players_db = None
+_players_expires = 0
+_PLAYERS_LOCK = asyncio.Lock()
+
+# player_id -> tuple of formatter fields, cleared whenever the player database is reloaded
+_PLAYER_INDEX = {}
+
+# Adaptive cap on concurrent API requests to stay under Sleeper's rate limit
+MIN_CONCURRENCY = 2
+MAX_CONCURRENCY = 32
+CONCURRENCY_GROWTH_STREAK = 20  # successful responses before allowing one more
+
+_concurrency = 16
+_in_flight = 0
+_success_streak = 0
+_SLOTS = asyncio.Condition()
+
+
+# Initialize MCP server
+mcp = FastMCP("sleeper", lifespan=lifespan)
 
 # === UTILITY FUNCTIONS ===
 
 
-async def fetch_json(url: str):
-    """Fetch JSON data from Sleeper API."""
-    async with httpx.AsyncClient() as client:
+def requires_league_id(fn):
+    """Resolve league_id from the argument or SLEEPER_LEAGUE_ID before running a league tool."""
+
+    @wraps(fn)
+    async def wrapper(league_id: str = "", *args, **kwargs):
+        resolved = league_id.strip() or LEAGUE_ID
+        if not resolved:
+            return "❌ Error: League ID is required (provide league_id or set SLEEPER_LEAGUE_ID environment variable)"
+        return await fn(resolved, *args, **kwargs)
+
+    return wrapper
+
+
+@asynccontextmanager
+async def request_slot():
+    """Wait for a free request slot under the current concurrency limit."""
+    global _in_flight
+
+    async with _SLOTS:
+        await _SLOTS.wait_for(lambda: _in_flight < _concurrency)
+        _in_flight += 1
+    try:
+        yield
+    finally:
+        async with _SLOTS:
+            _in_flight -= 1
+            _SLOTS.notify_all()
+
+
+def adjust_concurrency(status_code: int):
+    """Halve the concurrency limit on 429/5xx responses and grow it back by one after a run of successes."""
+    global _concurrency, _success_streak
+
+    if status_code == 429 or status_code >= 500:
+        _success_streak = 0
+        if _concurrency > MIN_CONCURRENCY:
+            _concurrency = max(MIN_CONCURRENCY, _concurrency // 2)
+            logger.warning(
+                "API returned %s, reducing concurrency to %s", status_code, _concurrency
+            )
+    else:
+        _success_streak += 1
+        if _success_streak >= CONCURRENCY_GROWTH_STREAK:
+            _success_streak = 0
+            _concurrency = min(MAX_CONCURRENCY, _concurrency + 1)
+
+
+def log_content_encoding(response):
+    """Log the compression used by the API once, to confirm gzip/brotli is negotiated."""
+    global _encoding_logged
+
+    if not _encoding_logged and logger.isEnabledFor(logging.DEBUG):
+        _encoding_logged = True
+        logger.debug(
+            "API content-encoding: %s",
+            response.headers.get("content-encoding", "identity"),
+        )
+
+
+class SleeperAPIError(Exception):
+    """Error status returned by the Sleeper API."""
+
+    def __init__(self, status, reason):
+        super().__init__(status, reason)
+        self.status = status
+        self.reason = reason
+
+    def __str__(self):
+        return f"API Error {self.status}: {self.reason}"
+
+
+async def request_json(path: str, _client=_CLIENT, _loads=orjson.loads):
+    """Request JSON data from Sleeper API using a path relative to BASE_URL."""
+    # Module globals are bound as defaults so the hot path uses fast local lookups
+    async with request_slot():
         try:
-            response = await client.get(url, timeout=10)
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPStatusError as e:
-            raise Exception(f"API Error {e.response.status_code}: {e.response.text}")
-        except Exception as e:
-            raise Exception(f"Request failed: {str(e)}")
+            response = await _client.get(path)
+        except httpx.TransportError as e:
+            # Timeouts often have an empty message, so always name the error type
+            detail = f"{type(e).__name__}: {e}" if str(e) else type(e).__name__
+            raise Exception(f"Request failed: {detail}") from e
+    status_code = response.status_code
+    adjust_concurrency(status_code)
+    log_content_encoding(response)
+    if status_code >= 400:
+        raise SleeperAPIError(status_code, response.reason_phrase)
+    return _loads(response.content)
+
+
+async def warm_cache():
+    """Prefetch the endpoints most sessions start with for the default league."""
+    results = await asyncio.gather(
+        fetch_json("/state/nfl"),
+        fetch_json(f"/league/{LEAGUE_ID}"),
+        fetch_json(f"/league/{LEAGUE_ID}/rosters"),
+        return_exceptions=True,
+    )
+    for result in results:
+        if isinstance(result, Exception):
+            logger.warning("Cache warmup request failed: %s", result)
+
+
+def cache_ttl(path: str):
+    """Return the cache TTL in seconds for an API path."""
+    for pattern, ttl in CACHE_TTLS.items():
+        if fnmatch.fnmatchcase(path, pattern):
+            return ttl
+    return DEFAULT_CACHE_TTL
+
+
+async def refresh_json(path: str):
+    """Request a path from the API and cache it, falling back to stale data on failure."""
+    cached = _CACHE.get(path)
+    try:
+        data = await request_json(path)
+    except Exception as e:
+        if cached:
+            logger.warning("Serving stale data for %s: %s", path, e)
+            return cached[1]
+        raise
+
+    ttl = cache_ttl(path)
+    if ttl:
+        _CACHE[path] = (time.monotonic() + ttl, data)
+    return data
+
+
+async def fetch_json(
+    path: str, _cache=_CACHE, _inflight=_INFLIGHT, _monotonic=time.monotonic
+):
+    """Fetch JSON data from Sleeper API, serving repeat requests from the TTL cache."""
+    cached = _cache.get(path)
+    if cached and cached[0] > _monotonic():
+        return cached[1]
+
+    # Concurrent requests for the same path share a single API call
+    task = _inflight.get(path)
+    if task is None:
+
+        def done(finished):
+            _inflight.pop(path, None)
+            # Retrieve the outcome so a failure with no waiters left is not logged as unhandled
+            if not finished.cancelled():
+                finished.exception()
+
+        task = asyncio.create_task(refresh_json(path))
+        _inflight[path] = task
+        task.add_done_callback(done)
+    return await asyncio.shield(task)
+
+
+def build_players_db(conn, all_players):
+    """Fill a SQLite database with trimmed player records keyed by player ID."""
+    conn.execute("CREATE TABLE players (player_id TEXT PRIMARY KEY, data BLOB)")
+    conn.executemany(
+        "INSERT INTO players VALUES (?, ?)",
+        (
+            (pid, orjson.dumps({k: player[k] for k in PLAYER_FIELDS if k in player}))
+            for pid, player in all_players.items()
+        ),
+    )
+    conn.commit()
+
+
+def save_players(all_players):
+    """Write the player database to the disk cache atomically and return a connection to it."""
+    tmp_path = PLAYERS_CACHE_PATH.with_suffix(".tmp")
+    try:
+        tmp_path.unlink(missing_ok=True)
+        conn = sqlite3.connect(tmp_path)
+        try:
+            build_players_db(conn, all_players)
+        finally:
+            conn.close()
+        os.replace(tmp_path, PLAYERS_CACHE_PATH)
+        return sqlite3.connect(f"file:{PLAYERS_CACHE_PATH}?mode=ro", uri=True)
+    except (OSError, sqlite3.Error) as e:
+        logger.warning("Could not write player cache %s: %s", PLAYERS_CACHE_PATH, e)
+        conn = sqlite3.connect(":memory:")
+        build_players_db(conn, all_players)
+        return conn
+
+
+async def players_db():
+    """Return a connection to the NFL player database, refreshing it from the API once a day."""
+    global _players_db, _players_expires
+
+    async with _PLAYERS_LOCK:
+        now = time.time()
+        if _players_db is not None and _players_expires > now:
+            return _players_db
+
+        try:
+            mtime = PLAYERS_CACHE_PATH.stat().st_mtime
+        except OSError:
+            mtime = 0
+
+        if _players_db is not None:
+            _players_db.close()
+            _players_db = None
+        _PLAYER_INDEX.clear()
+
+        if mtime <= now - PLAYERS_CACHE_TTL:
+            try:
+                all_players = await fetch_json("/players/nfl")
+            except Exception as e:
+                if not mtime:
+                    raise
+                logger.warning("Serving stale player cache: %s", e)
+            else:
+                _players_db = save_players(all_players)
+                _players_expires = now + PLAYERS_CACHE_TTL
+                return _players_db
+
+        _players_db = sqlite3.connect(f"file:{PLAYERS_CACHE_PATH}?mode=ro", uri=True)
+        _players_expires = max(mtime + PLAYERS_CACHE_TTL, now + 60)
+        return _players_db
+
+
+def player_entry(player):
+    """Convert a player record into a compact tuple of the fields search_player_info shows."""
+    return (
+        player.get("first_name", ""),
+        player.get("last_name", ""),
+        player.get("position", "N/A"),
+        player.get("team", "N/A"),
+        player.get("number", "N/A"),
+        player.get("status", "N/A"),
+        player.get("age", "N/A"),
+        player.get("height", "N/A"),
+        player.get("weight", "N/A"),
+        player.get("college", "N/A"),
+        player.get("years_exp", "N/A"),
+        tuple(player.get("fantasy_positions") or ()),
+        player.get("injury_status"),
+    )
+
+
+async def get_player(player_id: str):
+    """Look up a player's formatter fields by ID, keeping them in memory after the first lookup."""
+    db = await players_db()
+    entry = _PLAYER_INDEX.get(player_id)
+    if entry is None:
+        row = db.execute(
+            "SELECT data FROM players WHERE player_id = ?", (player_id,)
+        ).fetchone()
+        if not row:
+            return None
+        entry = _PLAYER_INDEX[player_id] = player_entry(orjson.loads(row[0]))
+    return entry
+
+
+# Response templates, filled with str.format_map
+USER_TEMPLATE = """👤 User: {display_name} (@{username})
+- User ID: {user_id}
+- Avatar: {avatar}"""
+
+LEAGUE_TEMPLATE = """🏈 League: {name}
+- League ID: {league_id}
+- Season: {season}
+- Status: {status}
+- Sport: {sport}
+- Total Rosters: {total_rosters}
+- Draft ID: {draft_id}"""
+
+ROSTER_TEMPLATE = """📊 Roster {number} (ID: {roster_id})
+- Owner: {owner_id}
+- Record: {wins}W - {losses}L - {ties}T
+- Points For: {fpts}.{fpts_decimal}
+- Points Against: {fpts_against}.{fpts_against_decimal}
+- Players: {player_count} total
+- Starters: {starters}"""
+
+NFL_STATE_TEMPLATE = """🏈 NFL State:
+- Current Week: {week}
+- Display Week: {display_week}
+- Season: {season}
+- Season Type: {season_type}
+- Season Start: {season_start_date}
+- League Season: {league_season}
+- League Create Season: {league_create_season}
+- Previous Season: {previous_season}"""
+
+DRAFT_TEMPLATE = """📝 Draft Details:
+- Draft ID: {draft_id}
+- Type: {type}
+- Status: {status}
+- League ID: {league_id}
+- Season: {season}
+- Sport: {sport}
+
+⚙️ Settings:
+- Teams: {teams}
+- Rounds: {rounds}
+- Pick Timer: {pick_timer} seconds
+- Scoring: {scoring_type}
+
+📊 Roster Slots:
+- QB: {slots_qb}
+- RB: {slots_rb}
+- WR: {slots_wr}
+- TE: {slots_te}
+- FLEX: {slots_flex}
+- K: {slots_k}
+- DEF: {slots_def}
+- BN: {slots_bn}"""
+
+DRAFT_SLOTS = (
+    "slots_qb",
+    "slots_rb",
+    "slots_wr",
+    "slots_te",
+    "slots_flex",
+    "slots_k",
+    "slots_def",
+    "slots_bn",
+)
+
+
+class TemplateFields(dict):
+    """Template values that render missing fields as N/A."""
+
+    def __missing__(self, key):
+        return "N/A"
 
 
 def format_user(user):
     """Format user object for display."""
     if not user:
         return "No user data"
-    return f"""👤 User: {user.get("display_name", "N/A")} (@{user.get("username", "N/A")})
-- User ID: {user.get("user_id", "N/A")}
-- Avatar: {user.get("avatar", "N/A")}"""
+    return USER_TEMPLATE.format_map(TemplateFields(user))
 
 
 def format_league(league):
     """Format league object for display."""
     if not league:
         return "No league data"
-    return f"""🏈 League: {league.get("name", "N/A")}
-- League ID: {league.get("league_id", "N/A")}
-- Season: {league.get("season", "N/A")}
-- Status: {league.get("status", "N/A")}
-- Sport: {league.get("sport", "N/A")}
-- Total Rosters: {league.get("total_rosters", "N/A")}
-- Draft ID: {league.get("draft_id", "N/A")}"""
+    return LEAGUE_TEMPLATE.format_map(TemplateFields(league))
+
+
+def format_starters(starters):
+    """Format the first five starters, adding ... when there are more."""
+    if not starters:
+        return ""
+    more = "..." if len(starters) > 5 else ""
+    return f"{', '.join(starters[:5])}{more}"
 
 
 def format_roster(roster, index):
     """Format roster object for display."""
     settings = roster.get("settings", {})
-    return f"""📊 Roster {index + 1} (ID: {roster.get("roster_id", "N/A")})
-- Owner: {roster.get("owner_id", "N/A")}
-- Record: {settings.get("wins", 0)}W - {settings.get("losses", 0)}L - {settings.get("ties", 0)}T
-- Points For: {settings.get("fpts", 0)}.{settings.get("fpts_decimal", 0)}
-- Points Against: {settings.get("fpts_against", 0)}.{settings.get("fpts_against_decimal", 0)}
-- Players: {len(roster.get("players", []))} total
-- Starters: {", ".join(roster.get("starters", [])[:5])}{"..." if len(roster.get("starters", [])) > 5 else ""}"""
+    return ROSTER_TEMPLATE.format_map(
+        {
+            "number": index + 1,
+            "roster_id": roster.get("roster_id", "N/A"),
+            "owner_id": roster.get("owner_id", "N/A"),
+            "wins": settings.get("wins", 0),
+            "losses": settings.get("losses", 0),
+            "ties": settings.get("ties", 0),
+            "fpts": settings.get("fpts", 0),
+            "fpts_decimal": settings.get("fpts_decimal", 0),
+            "fpts_against": settings.get("fpts_against", 0),
+            "fpts_against_decimal": settings.get("fpts_against_decimal", 0),
+            "player_count": len(roster.get("players") or []),
+            "starters": format_starters(roster.get("starters")),
+        }
+    )
 
 
 # === MCP TOOLS ===
@@ -81,17 +509,17 @@ def format_roster(roster, index):
 @mcp.tool()
 async def get_user(username: str = "") -> str:
     """Get Sleeper user information by username or user ID."""
-    logger.info(f"Fetching user: {username}")
+    logger.info("Fetching user: %s", username)
 
     if not username.strip():
         return "❌ Error: Username or user ID is required"
 
     try:
-        url = f"{BASE_URL}/user/{username}"
+        url = f"/user/{username}"
         user = await fetch_json(url)
         return f"✅ User Found:\n{format_user(user)}"
     except Exception as e:
-        logger.error(f"Error: {e}")
+        logger.error("Error: %s", e)
         return f"❌ Error: {str(e)}"
 
 
@@ -100,177 +528,261 @@ async def get_user_leagues(
     user_id: str = "", sport: str = "nfl", season: str = "2024"
 ) -> str:
     """Get all leagues for a user in a specific sport and season."""
-    logger.info(f"Fetching leagues for user {user_id}")
+    logger.info("Fetching leagues for user %s", user_id)
 
     if not user_id.strip():
         return "❌ Error: User ID is required"
 
     try:
-        url = f"{BASE_URL}/user/{user_id}/leagues/{sport}/{season}"
+        url = f"/user/{user_id}/leagues/{sport}/{season}"
         leagues = await fetch_json(url)
 
         if not leagues:
             return f"📭 No leagues found for user {user_id} in {sport} {season}"
 
-        result = f"🏈 Found {len(leagues)} league(s):\n\n"
+        parts = [f"🏈 Found {len(leagues)} league(s):\n\n"]
         for i, league in enumerate(leagues, 1):
-            result += f"{i}. {format_league(league)}\n\n"
+            parts.append(f"{i}. {format_league(league)}\n\n")
 
-        return result
+        return "".join(parts)
     except Exception as e:
-        logger.error(f"Error: {e}")
+        logger.error("Error: %s", e)
         return f"❌ Error: {str(e)}"
 
 
 @mcp.tool()
+@requires_league_id
 async def get_league(league_id: str = "") -> str:
     """Get detailed information about a specific league."""
-    logger.info(f"Fetching league: {league_id}")
-
-    lid = league_id.strip() or LEAGUE_ID.strip()
-    if not lid:
-        return "❌ Error: League ID is required (provide league_id or set SLEEPER_LEAGUE_ID environment variable)"
+    logger.info("Fetching league: %s", league_id)
 
     try:
-        url = f"{BASE_URL}/league/{lid}"
+        url = f"/league/{league_id}"
         league = await fetch_json(url)
 
-        result = f"✅ League Details:\n{format_league(league)}\n\n"
+        parts = [f"✅ League Details:\n{format_league(league)}\n\n"]
 
         if league.get("settings"):
             settings = league["settings"]
-            result += f"⚙️ Settings:\n"
-            result += f"- Playoff Teams: {settings.get('playoff_teams', 'N/A')}\n"
-            result += f"- Waiver Type: {settings.get('waiver_type', 'N/A')}\n"
-            result += (
+            parts.append(f"⚙️ Settings:\n")
+            parts.append(f"- Playoff Teams: {settings.get('playoff_teams', 'N/A')}\n")
+            parts.append(f"- Waiver Type: {settings.get('waiver_type', 'N/A')}\n")
+            parts.append(
                 f"- Trade Deadline: Week {settings.get('trade_deadline', 'N/A')}\n"
             )
 
-        return result
+        return "".join(parts)
     except Exception as e:
-        logger.error(f"Error: {e}")
+        logger.error("Error: %s", e)
         return f"❌ Error: {str(e)}"
 
 
 @mcp.tool()
+@requires_league_id
+async def get_league_overview(league_id: str = "") -> str:
+    """Get a league summary with standings, team managers, and current week matchups in one call."""
+    logger.info("Fetching overview for league: %s", league_id)
+
+    try:
+        league, rosters, users, state = await asyncio.gather(
+            fetch_json(f"/league/{league_id}"),
+            fetch_json(f"/league/{league_id}/rosters"),
+            fetch_json(f"/league/{league_id}/users"),
+            fetch_json("/state/nfl"),
+            return_exceptions=True,
+        )
+
+        if isinstance(league, Exception):
+            parts = [f"❌ League details unavailable: {league}\n\n"]
+        else:
+            parts = [f"✅ League Overview:\n{format_league(league)}\n\n"]
+
+        week = None
+        if isinstance(state, Exception):
+            parts.append(f"❌ NFL state unavailable: {state}\n\n")
+        elif state:
+            week = state.get("week")
+            parts.append(
+                f"📅 NFL Week {week} ({state.get('season_type', 'N/A')} {state.get('season', 'N/A')})\n\n"
+            )
+
+        teams = {}
+        if isinstance(users, Exception):
+            parts.append(f"❌ League users unavailable: {users}\n\n")
+        else:
+            for user in users or []:
+                team_name = (user.get("metadata") or {}).get("team_name")
+                display_name = user.get("display_name", "N/A")
+                teams[user.get("user_id")] = (
+                    f"{team_name} ({display_name})" if team_name else display_name
+                )
+
+        owners = {}
+        if isinstance(rosters, Exception):
+            parts.append(f"❌ Standings unavailable: {rosters}\n\n")
+        elif rosters:
+            for roster in rosters:
+                owners[roster.get("roster_id")] = teams.get(
+                    roster.get("owner_id"), f"Roster {roster.get('roster_id', 'N/A')}"
+                )
+
+            standings = sorted(
+                rosters,
+                key=lambda r: (
+                    (r.get("settings") or {}).get("wins", 0),
+                    (r.get("settings") or {}).get("fpts", 0),
+                ),
+                reverse=True,
+            )
+            parts.append("📊 Standings:\n")
+            for i, roster in enumerate(standings, 1):
+                settings = roster.get("settings") or {}
+                parts.append(
+                    f"{i}. {owners[roster.get('roster_id')]} - "
+                    f"{settings.get('wins', 0)}W-{settings.get('losses', 0)}L-{settings.get('ties', 0)}T, "
+                    f"{settings.get('fpts', 0)}.{settings.get('fpts_decimal', 0)} pts\n"
+                )
+            parts.append("\n")
+
+        if week:
+            try:
+                matchups = await fetch_json(f"/league/{league_id}/matchups/{week}")
+            except Exception as e:
+                parts.append(f"❌ Week {week} matchups unavailable: {e}\n")
+            else:
+                games = defaultdict(list)
+                for team in matchups or []:
+                    games[team.get("matchup_id")].append(team)
+
+                if games:
+                    parts.append(f"⚔️ Week {week} Matchups:\n")
+                    for mid, game in games.items():
+                        sides = []
+                        for team in game:
+                            rid = team.get("roster_id")
+                            custom = team.get("custom_points")
+                            points = (
+                                custom if custom is not None else team.get("points", 0)
+                            )
+                            sides.append(
+                                f"{owners.get(rid, f'Roster {rid}')} ({points})"
+                            )
+                        parts.append(f"  Matchup {mid}: {' vs '.join(sides)}\n")
+
+        return "".join(parts)
+    except Exception as e:
+        logger.error("Error: %s", e)
+        return f"❌ Error: {str(e)}"
+
+
+@mcp.tool()
+@requires_league_id
 async def get_league_rosters(league_id: str = "") -> str:
     """Get all rosters in a league with standings and player information."""
-    logger.info(f"Fetching rosters for league: {league_id}")
-
-    lid = league_id.strip() or LEAGUE_ID.strip()
-    if not lid:
-        return "❌ Error: League ID is required (provide league_id or set SLEEPER_LEAGUE_ID environment variable)"
+    logger.info("Fetching rosters for league: %s", league_id)
 
     try:
-        url = f"{BASE_URL}/league/{lid}/rosters"
+        url = f"/league/{league_id}/rosters"
         rosters = await fetch_json(url)
 
         if not rosters:
-            return f"📭 No rosters found for league {lid}"
+            return f"📭 No rosters found for league {league_id}"
 
-        result = f"📊 Found {len(rosters)} roster(s):\n\n"
+        parts = [f"📊 Found {len(rosters)} roster(s):\n\n"]
         for i, roster in enumerate(rosters):
-            result += f"{format_roster(roster, i)}\n\n"
+            parts.append(f"{format_roster(roster, i)}\n\n")
 
-        return result
+        return "".join(parts)
     except Exception as e:
-        logger.error(f"Error: {e}")
+        logger.error("Error: %s", e)
         return f"❌ Error: {str(e)}"
 
 
 @mcp.tool()
+@requires_league_id
 async def get_league_users(league_id: str = "") -> str:
     """Get all users in a league with their team information."""
-    logger.info(f"Fetching users for league: {league_id}")
-
-    lid = league_id.strip() or LEAGUE_ID.strip()
-    if not lid:
-        return "❌ Error: League ID is required (provide league_id or set SLEEPER_LEAGUE_ID environment variable)"
+    logger.info("Fetching users for league: %s", league_id)
 
     try:
-        url = f"{BASE_URL}/league/{lid}/users"
+        url = f"/league/{league_id}/users"
         users = await fetch_json(url)
 
         if not users:
-            return f"📭 No users found for league {lid}"
+            return f"📭 No users found for league {league_id}"
 
-        result = f"👥 Found {len(users)} user(s):\n\n"
+        parts = [f"👥 Found {len(users)} user(s):\n\n"]
         for i, user in enumerate(users, 1):
             metadata = user.get("metadata", {})
             team_name = metadata.get("team_name", "No team name")
             is_owner = "👑 Commissioner" if user.get("is_owner") else ""
-            result += f"{i}. {user.get('display_name', 'N/A')} (@{user.get('username', 'N/A')}) {is_owner}\n"
-            result += f"   Team: {team_name}\n"
-            result += f"   User ID: {user.get('user_id', 'N/A')}\n\n"
+            parts.append(
+                f"{i}. {user.get('display_name', 'N/A')} (@{user.get('username', 'N/A')}) {is_owner}\n"
+            )
+            parts.append(f"   Team: {team_name}\n")
+            parts.append(f"   User ID: {user.get('user_id', 'N/A')}\n\n")
 
-        return result
+        return "".join(parts)
     except Exception as e:
-        logger.error(f"Error: {e}")
+        logger.error("Error: %s", e)
         return f"❌ Error: {str(e)}"
 
 
 @mcp.tool()
+@requires_league_id
 async def get_league_matchups(league_id: str = "", week: str = "1") -> str:
     """Get all matchups for a specific week in a league."""
-    logger.info(f"Fetching matchups for league {league_id}, week {week}")
-
-    lid = league_id.strip() or LEAGUE_ID.strip()
-    if not lid:
-        return "❌ Error: League ID is required (provide league_id or set SLEEPER_LEAGUE_ID environment variable)"
+    logger.info("Fetching matchups for league %s, week %s", league_id, week)
 
     if not week.strip():
         return "❌ Error: Week number is required"
 
     try:
-        url = f"{BASE_URL}/league/{lid}/matchups/{week}"
+        url = f"/league/{league_id}/matchups/{week}"
         matchups = await fetch_json(url)
 
         if not matchups:
-            return f"📭 No matchups found for league {lid}, week {week}"
+            return f"📭 No matchups found for league {league_id}, week {week}"
 
-        matchup_dict = {}
+        matchup_dict = defaultdict(list)
         for matchup in matchups:
-            mid = matchup.get("matchup_id")
-            if mid not in matchup_dict:
-                matchup_dict[mid] = []
-            matchup_dict[mid].append(matchup)
+            matchup_dict[matchup.get("matchup_id")].append(matchup)
 
-        result = f"🏈 Week {week} Matchups:\n\n"
+        parts = [f"🏈 Week {week} Matchups:\n\n"]
         for mid, teams in matchup_dict.items():
-            result += f"⚔️ Matchup {mid}:\n"
+            parts.append(f"⚔️ Matchup {mid}:\n")
             for team in teams:
                 points = team.get("points", 0)
                 custom = team.get("custom_points")
                 points_str = (
                     f"{custom} (override)" if custom is not None else f"{points}"
                 )
-                result += f"  Roster {team.get('roster_id', 'N/A')}: {points_str} pts\n"
-                result += f"    Starters: {', '.join(team.get('starters', [])[:5])}{'...' if len(team.get('starters', [])) > 5 else ''}\n"
-            result += "\n"
+                parts.append(
+                    f"  Roster {team.get('roster_id', 'N/A')}: {points_str} pts\n"
+                )
+                parts.append(f"    Starters: {format_starters(team.get('starters'))}\n")
+            parts.append("\n")
 
-        return result
+        return "".join(parts)
     except Exception as e:
-        logger.error(f"Error: {e}")
+        logger.error("Error: %s", e)
         return f"❌ Error: {str(e)}"
 
 
 @mcp.tool()
+@requires_league_id
 async def get_winners_bracket(league_id: str = "") -> str:
     """Get the winners playoff bracket for a league."""
-    logger.info(f"Fetching winners bracket for league: {league_id}")
-
-    lid = league_id.strip() or LEAGUE_ID.strip()
-    if not lid:
-        return "❌ Error: League ID is required (provide league_id or set SLEEPER_LEAGUE_ID environment variable)"
+    logger.info("Fetching winners bracket for league: %s", league_id)
 
     try:
-        url = f"{BASE_URL}/league/{lid}/winners_bracket"
+        url = f"/league/{league_id}/winners_bracket"
         bracket = await fetch_json(url)
 
         if not bracket:
-            return f"📭 No playoff bracket found for league {lid}"
+            return f"📭 No playoff bracket found for league {league_id}"
 
-        result = f"🏆 Winners Bracket:\n\n"
+        parts = [f"🏆 Winners Bracket:\n\n"]
         for match in bracket:
             round_num = match.get("r", "N/A")
             match_id = match.get("m", "N/A")
@@ -278,36 +790,33 @@ async def get_winners_bracket(league_id: str = "") -> str:
             t2 = match.get("t2", "TBD")
             winner = match.get("w", "TBD")
 
-            result += f"Round {round_num}, Match {match_id}:\n"
-            result += f"  Team 1: Roster {t1}\n"
-            result += f"  Team 2: Roster {t2}\n"
+            parts.append(f"Round {round_num}, Match {match_id}:\n")
+            parts.append(f"  Team 1: Roster {t1}\n")
+            parts.append(f"  Team 2: Roster {t2}\n")
             if winner != "TBD" and winner is not None:
-                result += f"  Winner: Roster {winner}\n"
-            result += "\n"
+                parts.append(f"  Winner: Roster {winner}\n")
+            parts.append("\n")
 
-        return result
+        return "".join(parts)
     except Exception as e:
-        logger.error(f"Error: {e}")
+        logger.error("Error: %s", e)
         return f"❌ Error: {str(e)}"
 
 
 @mcp.tool()
+@requires_league_id
 async def get_losers_bracket(league_id: str = "") -> str:
     """Get the losers playoff bracket for a league."""
-    logger.info(f"Fetching losers bracket for league: {league_id}")
-
-    lid = league_id.strip() or LEAGUE_ID.strip()
-    if not lid:
-        return "❌ Error: League ID is required (provide league_id or set SLEEPER_LEAGUE_ID environment variable)"
+    logger.info("Fetching losers bracket for league: %s", league_id)
 
     try:
-        url = f"{BASE_URL}/league/{lid}/losers_bracket"
+        url = f"/league/{league_id}/losers_bracket"
         bracket = await fetch_json(url)
 
         if not bracket:
-            return f"📭 No losers bracket found for league {lid}"
+            return f"📭 No losers bracket found for league {league_id}"
 
-        result = f"🎯 Losers Bracket:\n\n"
+        parts = [f"🎯 Losers Bracket:\n\n"]
         for match in bracket:
             round_num = match.get("r", "N/A")
             match_id = match.get("m", "N/A")
@@ -316,85 +825,93 @@ async def get_losers_bracket(league_id: str = "") -> str:
             winner = match.get("w", "TBD")
             placement = match.get("p", "")
 
-            result += f"Round {round_num}, Match {match_id}"
+            parts.append(f"Round {round_num}, Match {match_id}")
             if placement:
-                result += f" (for place {placement})"
-            result += ":\n"
-            result += f"  Team 1: Roster {t1}\n"
-            result += f"  Team 2: Roster {t2}\n"
+                parts.append(f" (for place {placement})")
+            parts.append(":\n")
+            parts.append(f"  Team 1: Roster {t1}\n")
+            parts.append(f"  Team 2: Roster {t2}\n")
             if winner != "TBD" and winner is not None:
-                result += f"  Winner: Roster {winner}\n"
-            result += "\n"
+                parts.append(f"  Winner: Roster {winner}\n")
+            parts.append("\n")
 
-        return result
+        return "".join(parts)
     except Exception as e:
-        logger.error(f"Error: {e}")
+        logger.error("Error: %s", e)
         return f"❌ Error: {str(e)}"
 
 
 @mcp.tool()
+@requires_league_id
 async def get_league_transactions(league_id: str = "", week: str = "1") -> str:
     """Get all transactions for a specific week in a league including trades, waivers, and free agent pickups."""
-    logger.info(f"Fetching transactions for league {league_id}, week {week}")
-
-    lid = league_id.strip() or LEAGUE_ID.strip()
-    if not lid:
-        return "❌ Error: League ID is required (provide league_id or set SLEEPER_LEAGUE_ID environment variable)"
+    logger.info("Fetching transactions for league %s, week %s", league_id, week)
 
     if not week.strip():
         return "❌ Error: Week number is required"
 
     try:
-        url = f"{BASE_URL}/league/{lid}/transactions/{week}"
+        url = f"/league/{league_id}/transactions/{week}"
         transactions = await fetch_json(url)
 
         if not transactions:
-            return f"📭 No transactions found for league {lid}, week {week}"
+            return f"📭 No transactions found for league {league_id}, week {week}"
 
-        result = f"💼 Week {week} Transactions ({len(transactions)} total):\n\n"
+        parts = [f"💼 Week {week} Transactions ({len(transactions)} total):\n\n"]
+        append = parts.append
 
         for i, txn in enumerate(transactions, 1):
             txn_type = txn.get("type", "unknown")
             status = txn.get("status", "unknown")
 
-            result += f"{i}. Type: {txn_type.upper()} - Status: {status}\n"
-
-            if txn.get("adds"):
-                result += f"   Adds: {', '.join([f'Player {pid} to Roster {rid}' for pid, rid in txn['adds'].items()])}\n"
+            append(f"{i}. Type: {txn_type.upper()} - Status: {status}\n")
 
-            if txn.get("drops"):
-                result += f"   Drops: {', '.join([f'Player {pid} from Roster {rid}' for pid, rid in txn['drops'].items()])}\n"
-
-            if txn.get("draft_picks"):
-                result += (
-                    f"   Draft Picks: {len(txn['draft_picks'])} pick(s) involved\n"
+            adds = txn.get("adds")
+            if adds:
+                append("   Adds: ")
+                append(
+                    ", ".join(
+                        f"Player {pid} to Roster {rid}" for pid, rid in adds.items()
+                    )
+                )
+                append("\n")
+
+            drops = txn.get("drops")
+            if drops:
+                append("   Drops: ")
+                append(
+                    ", ".join(
+                        f"Player {pid} from Roster {rid}" for pid, rid in drops.items()
+                    )
                 )
+                append("\n")
 
-            result += "\n"
+            draft_picks = txn.get("draft_picks")
+            if draft_picks:
+                append(f"   Draft Picks: {len(draft_picks)} pick(s) involved\n")
 
-        return result
+            append("\n")
+
+        return "".join(parts)
     except Exception as e:
-        logger.error(f"Error: {e}")
+        logger.error("Error: %s", e)
         return f"❌ Error: {str(e)}"
 
 
 @mcp.tool()
+@requires_league_id
 async def get_traded_picks(league_id: str = "") -> str:
     """Get all traded draft picks in a league including future picks."""
-    logger.info(f"Fetching traded picks for league: {league_id}")
-
-    lid = league_id.strip() or LEAGUE_ID.strip()
-    if not lid:
-        return "❌ Error: League ID is required (provide league_id or set SLEEPER_LEAGUE_ID environment variable)"
+    logger.info("Fetching traded picks for league: %s", league_id)
 
     try:
-        url = f"{BASE_URL}/league/{lid}/traded_picks"
+        url = f"/league/{league_id}/traded_picks"
         picks = await fetch_json(url)
 
         if not picks:
-            return f"📭 No traded picks found for league {lid}"
+            return f"📭 No traded picks found for league {league_id}"
 
-        result = f"🔄 Traded Draft Picks ({len(picks)} total):\n\n"
+        parts = [f"🔄 Traded Draft Picks ({len(picks)} total):\n\n"]
 
         for i, pick in enumerate(picks, 1):
             season = pick.get("season", "N/A")
@@ -403,14 +920,14 @@ async def get_traded_picks(league_id: str = "") -> str:
             previous = pick.get("previous_owner_id", "N/A")
             current = pick.get("owner_id", "N/A")
 
-            result += f"{i}. {season} Round {round_num}\n"
-            result += f"   Original Owner: Roster {original}\n"
-            result += f"   Previous Owner: Roster {previous}\n"
-            result += f"   Current Owner: Roster {current}\n\n"
+            parts.append(f"{i}. {season} Round {round_num}\n")
+            parts.append(f"   Original Owner: Roster {original}\n")
+            parts.append(f"   Previous Owner: Roster {previous}\n")
+            parts.append(f"   Current Owner: Roster {current}\n\n")
 
-        return result
+        return "".join(parts)
     except Exception as e:
-        logger.error(f"Error: {e}")
+        logger.error("Error: %s", e)
         return f"❌ Error: {str(e)}"
 
 
@@ -420,22 +937,12 @@ async def get_nfl_state() -> str:
     logger.info("Fetching NFL state")
 
     try:
-        url = f"{BASE_URL}/state/nfl"
+        url = "/state/nfl"
         state = await fetch_json(url)
 
-        result = f"""🏈 NFL State:
-- Current Week: {state.get("week", "N/A")}
-- Display Week: {state.get("display_week", "N/A")}
-- Season: {state.get("season", "N/A")}
-- Season Type: {state.get("season_type", "N/A")}
-- Season Start: {state.get("season_start_date", "N/A")}
-- League Season: {state.get("league_season", "N/A")}
-- League Create Season: {state.get("league_create_season", "N/A")}
-- Previous Season: {state.get("previous_season", "N/A")}"""
-
-        return result
+        return NFL_STATE_TEMPLATE.format_map(TemplateFields(state))
     except Exception as e:
-        logger.error(f"Error: {e}")
+        logger.error("Error: %s", e)
         return f"❌ Error: {str(e)}"
 
 
@@ -444,128 +951,110 @@ async def get_user_drafts(
     user_id: str = "", sport: str = "nfl", season: str = "2024"
 ) -> str:
     """Get all drafts for a user in a specific sport and season."""
-    logger.info(f"Fetching drafts for user {user_id}")
+    logger.info("Fetching drafts for user %s", user_id)
 
     if not user_id.strip():
         return "❌ Error: User ID is required"
 
     try:
-        url = f"{BASE_URL}/user/{user_id}/drafts/{sport}/{season}"
+        url = f"/user/{user_id}/drafts/{sport}/{season}"
         drafts = await fetch_json(url)
 
         if not drafts:
             return f"📭 No drafts found for user {user_id} in {sport} {season}"
 
-        result = f"📝 Found {len(drafts)} draft(s):\n\n"
+        parts = [f"📝 Found {len(drafts)} draft(s):\n\n"]
         for i, draft in enumerate(drafts, 1):
-            result += f"{i}. Draft ID: {draft.get('draft_id', 'N/A')}\n"
-            result += f"   Type: {draft.get('type', 'N/A')}\n"
-            result += f"   Status: {draft.get('status', 'N/A')}\n"
-            result += f"   League ID: {draft.get('league_id', 'N/A')}\n"
-            result += f"   Season: {draft.get('season', 'N/A')}\n\n"
+            parts.append(f"{i}. Draft ID: {draft.get('draft_id', 'N/A')}\n")
+            parts.append(f"   Type: {draft.get('type', 'N/A')}\n")
+            parts.append(f"   Status: {draft.get('status', 'N/A')}\n")
+            parts.append(f"   League ID: {draft.get('league_id', 'N/A')}\n")
+            parts.append(f"   Season: {draft.get('season', 'N/A')}\n\n")
 
-        return result
+        return "".join(parts)
     except Exception as e:
-        logger.error(f"Error: {e}")
+        logger.error("Error: %s", e)
         return f"❌ Error: {str(e)}"
 
 
 @mcp.tool()
+@requires_league_id
 async def get_league_drafts(league_id: str = "") -> str:
     """Get all drafts for a league."""
-    logger.info(f"Fetching drafts for league: {league_id}")
-
-    lid = league_id.strip() or LEAGUE_ID.strip()
-    if not lid:
-        return "❌ Error: League ID is required (provide league_id or set SLEEPER_LEAGUE_ID environment variable)"
+    logger.info("Fetching drafts for league: %s", league_id)
 
     try:
-        url = f"{BASE_URL}/league/{lid}/drafts"
+        url = f"/league/{league_id}/drafts"
         drafts = await fetch_json(url)
 
         if not drafts:
-            return f"📭 No drafts found for league {lid}"
+            return f"📭 No drafts found for league {league_id}"
 
-        result = f"📝 Found {len(drafts)} draft(s):\n\n"
+        parts = [f"📝 Found {len(drafts)} draft(s):\n\n"]
         for i, draft in enumerate(drafts, 1):
             settings = draft.get("settings", {})
             metadata = draft.get("metadata", {})
 
-            result += f"{i}. Draft ID: {draft.get('draft_id', 'N/A')}\n"
-            result += f"   Type: {draft.get('type', 'N/A')}\n"
-            result += f"   Status: {draft.get('status', 'N/A')}\n"
-            result += f"   Season: {draft.get('season', 'N/A')}\n"
-            result += f"   Teams: {settings.get('teams', 'N/A')}\n"
-            result += f"   Rounds: {settings.get('rounds', 'N/A')}\n"
-            result += f"   Scoring: {metadata.get('scoring_type', 'N/A')}\n\n"
+            parts.append(f"{i}. Draft ID: {draft.get('draft_id', 'N/A')}\n")
+            parts.append(f"   Type: {draft.get('type', 'N/A')}\n")
+            parts.append(f"   Status: {draft.get('status', 'N/A')}\n")
+            parts.append(f"   Season: {draft.get('season', 'N/A')}\n")
+            parts.append(f"   Teams: {settings.get('teams', 'N/A')}\n")
+            parts.append(f"   Rounds: {settings.get('rounds', 'N/A')}\n")
+            parts.append(f"   Scoring: {metadata.get('scoring_type', 'N/A')}\n\n")
 
-        return result
+        return "".join(parts)
     except Exception as e:
-        logger.error(f"Error: {e}")
+        logger.error("Error: %s", e)
         return f"❌ Error: {str(e)}"
 
 
 @mcp.tool()
 async def get_draft(draft_id: str = "") -> str:
     """Get detailed information about a specific draft."""
-    logger.info(f"Fetching draft: {draft_id}")
+    logger.info("Fetching draft: %s", draft_id)
 
     if not draft_id.strip():
         return "❌ Error: Draft ID is required"
 
     try:
-        url = f"{BASE_URL}/draft/{draft_id}"
+        url = f"/draft/{draft_id}"
         draft = await fetch_json(url)
 
         settings = draft.get("settings", {})
         metadata = draft.get("metadata", {})
 
-        result = f"""📝 Draft Details:
-- Draft ID: {draft.get("draft_id", "N/A")}
-- Type: {draft.get("type", "N/A")}
-- Status: {draft.get("status", "N/A")}
-- League ID: {draft.get("league_id", "N/A")}
-- Season: {draft.get("season", "N/A")}
-- Sport: {draft.get("sport", "N/A")}
-
-⚙️ Settings:
-- Teams: {settings.get("teams", "N/A")}
-- Rounds: {settings.get("rounds", "N/A")}
-- Pick Timer: {settings.get("pick_timer", "N/A")} seconds
-- Scoring: {metadata.get("scoring_type", "N/A")}
-
-📊 Roster Slots:
-- QB: {settings.get("slots_qb", 0)}
-- RB: {settings.get("slots_rb", 0)}
-- WR: {settings.get("slots_wr", 0)}
-- TE: {settings.get("slots_te", 0)}
-- FLEX: {settings.get("slots_flex", 0)}
-- K: {settings.get("slots_k", 0)}
-- DEF: {settings.get("slots_def", 0)}
-- BN: {settings.get("slots_bn", 0)}"""
+        fields = TemplateFields(draft)
+        fields.update(
+            teams=settings.get("teams", "N/A"),
+            rounds=settings.get("rounds", "N/A"),
+            pick_timer=settings.get("pick_timer", "N/A"),
+            scoring_type=metadata.get("scoring_type", "N/A"),
+        )
+        fields.update({slot: settings.get(slot, 0) for slot in DRAFT_SLOTS})
 
-        return result
+        return DRAFT_TEMPLATE.format_map(fields)
     except Exception as e:
-        logger.error(f"Error: {e}")
+        logger.error("Error: %s", e)
         return f"❌ Error: {str(e)}"
 
 
 @mcp.tool()
 async def get_draft_picks(draft_id: str = "") -> str:
     """Get all picks made in a draft."""
-    logger.info(f"Fetching draft picks for: {draft_id}")
+    logger.info("Fetching draft picks for: %s", draft_id)
 
     if not draft_id.strip():
         return "❌ Error: Draft ID is required"
 
     try:
-        url = f"{BASE_URL}/draft/{draft_id}/picks"
+        url = f"/draft/{draft_id}/picks"
         picks = await fetch_json(url)
 
         if not picks:
             return f"📭 No picks found for draft {draft_id}"
 
-        result = f"🎯 Draft Picks ({len(picks)} total):\n\n"
+        parts = [f"🎯 Draft Picks ({len(picks)} total):\n\n"]
 
         for pick in picks[:50]:
             metadata = pick.get("metadata", {})
@@ -573,50 +1062,56 @@ async def get_draft_picks(draft_id: str = "") -> str:
             position = metadata.get("position", "N/A")
             team = metadata.get("team", "N/A")
 
-            result += f"Pick {pick.get('pick_no', 'N/A')} (Round {pick.get('round', 'N/A')}):\n"
-            result += f"  Player: {player_name or 'Unknown'} - {position} ({team})\n"
-            result += f"  Roster ID: {pick.get('roster_id', 'N/A')}\n"
+            parts.append(
+                f"Pick {pick.get('pick_no', 'N/A')} (Round {pick.get('round', 'N/A')}):\n"
+            )
+            parts.append(
+                f"  Player: {player_name or 'Unknown'} - {position} ({team})\n"
+            )
+            parts.append(f"  Roster ID: {pick.get('roster_id', 'N/A')}\n")
             if pick.get("is_keeper"):
-                result += f"  ⭐ Keeper\n"
-            result += "\n"
+                parts.append(f"  ⭐ Keeper\n")
+            parts.append("\n")
 
         if len(picks) > 50:
-            result += f"... and {len(picks) - 50} more picks\n"
+            parts.append(f"... and {len(picks) - 50} more picks\n")
 
-        return result
+        return "".join(parts)
     except Exception as e:
-        logger.error(f"Error: {e}")
+        logger.error("Error: %s", e)
         return f"❌ Error: {str(e)}"
 
 
 @mcp.tool()
 async def get_draft_traded_picks(draft_id: str = "") -> str:
     """Get all traded picks in a draft."""
-    logger.info(f"Fetching traded draft picks for: {draft_id}")
+    logger.info("Fetching traded draft picks for: %s", draft_id)
 
     if not draft_id.strip():
         return "❌ Error: Draft ID is required"
 
     try:
-        url = f"{BASE_URL}/draft/{draft_id}/traded_picks"
+        url = f"/draft/{draft_id}/traded_picks"
         picks = await fetch_json(url)
 
         if not picks:
             return f"📭 No traded picks found for draft {draft_id}"
 
-        result = f"🔄 Traded Draft Picks ({len(picks)} total):\n\n"
+        parts = [f"🔄 Traded Draft Picks ({len(picks)} total):\n\n"]
 
         for i, pick in enumerate(picks, 1):
-            result += (
+            parts.append(
                 f"{i}. {pick.get('season', 'N/A')} Round {pick.get('round', 'N/A')}\n"
             )
-            result += f"   Original: Roster {pick.get('roster_id', 'N/A')}\n"
-            result += f"   Previous: Roster {pick.get('previous_owner_id', 'N/A')}\n"
-            result += f"   Current: Roster {pick.get('owner_id', 'N/A')}\n\n"
+            parts.append(f"   Original: Roster {pick.get('roster_id', 'N/A')}\n")
+            parts.append(
+                f"   Previous: Roster {pick.get('previous_owner_id', 'N/A')}\n"
+            )
+            parts.append(f"   Current: Roster {pick.get('owner_id', 'N/A')}\n\n")
 
-        return result
+        return "".join(parts)
     except Exception as e:
-        logger.error(f"Error: {e}")
+        logger.error("Error: %s", e)
         return f"❌ Error: {str(e)}"
 
 
@@ -625,87 +1120,114 @@ async def get_trending_players(
     trend_type: str = "add", lookback_hours: str = "24", limit: str = "25"
 ) -> str:
     """Get trending players based on add or drop activity."""
-    logger.info(f"Fetching trending {trend_type} players")
+    logger.info("Fetching trending %s players", trend_type)
 
-    if trend_type not in ["add", "drop"]:
+    if trend_type not in TREND_TYPES:
         return "❌ Error: trend_type must be 'add' or 'drop'"
 
     try:
-        lookback = int(lookback_hours) if lookback_hours.strip() else 24
-        lim = int(limit) if limit.strip() else 25
+        lookback = int(lookback_hours.strip() or 24)
+        lim = int(limit.strip() or 25)
     except ValueError:
         return "❌ Error: lookback_hours and limit must be valid numbers"
 
     try:
-        url = f"{BASE_URL}/players/nfl/trending/{trend_type}?lookback_hours={lookback}&limit={lim}"
+        query = urlencode({"lookback_hours": lookback, "limit": lim})
+        url = f"/players/nfl/trending/{trend_type}?{query}"
         players = await fetch_json(url)
 
         if not players:
             return f"📭 No trending {trend_type} players found"
 
         emoji = "📈" if trend_type == "add" else "📉"
-        result = f"{emoji} Trending {trend_type.upper()} Players (Last {lookback} hours):\n\n"
+        parts = [
+            f"{emoji} Trending {trend_type.upper()} Players (Last {lookback} hours):\n\n"
+        ]
 
         for i, player in enumerate(players, 1):
-            result += f"{i}. Player ID: {player.get('player_id', 'N/A')} - {player.get('count', 0)} {trend_type}s\n"
+            parts.append(
+                f"{i}. Player ID: {player.get('player_id', 'N/A')} - {player.get('count', 0)} {trend_type}s\n"
+            )
 
-        return result
+        return "".join(parts)
     except Exception as e:
-        logger.error(f"Error: {e}")
+        logger.error("Error: %s", e)
         return f"❌ Error: {str(e)}"
 
 
 @mcp.tool()
 async def search_player_info(player_id: str = "") -> str:
-    """Search for detailed information about a specific player by their player ID - requires fetching all players first."""
-    logger.info(f"Searching for player: {player_id}")
+    """Search for detailed information about a specific player by their player ID using a locally cached player database."""
+    logger.info("Searching for player: %s", player_id)
 
     if not player_id.strip():
         return "❌ Error: Player ID is required"
 
     try:
-        url = f"{BASE_URL}/players/nfl"
-        all_players = await fetch_json(url)
-
-        player = all_players.get(player_id)
+        player = await get_player(player_id)
         if not player:
             return f"❌ Player ID {player_id} not found"
 
-        result = f"""🏈 Player: {player.get("first_name", "")} {player.get("last_name", "")}
+        (
+            first_name,
+            last_name,
+            position,
+            team,
+            number,
+            status,
+            age,
+            height,
+            weight,
+            college,
+            years_exp,
+            fantasy_positions,
+            injury_status,
+        ) = player
+
+        result = f"""🏈 Player: {first_name} {last_name}
 - Player ID: {player_id}
-- Position: {player.get("position", "N/A")}
-- Team: {player.get("team", "N/A")}
-- Number: #{player.get("number", "N/A")}
-- Status: {player.get("status", "N/A")}
-- Age: {player.get("age", "N/A")}
-- Height: {player.get("height", "N/A")}
-- Weight: {player.get("weight", "N/A")}
-- College: {player.get("college", "N/A")}
-- Years Exp: {player.get("years_exp", "N/A")}
-- Fantasy Positions: {", ".join(player.get("fantasy_positions", []))}"""
-
-        if player.get("injury_status"):
-            result += f"\n⚠️ Injury Status: {player.get('injury_status', 'N/A')}"
+- Position: {position}
+- Team: {team}
+- Number: #{number}
+- Status: {status}
+- Age: {age}
+- Height: {height}
+- Weight: {weight}
+- College: {college}
+- Years Exp: {years_exp}
+- Fantasy Positions: {", ".join(fantasy_positions)}"""
+
+        if injury_status:
+            result += f"\n⚠️ Injury Status: {injury_status}"
 
         return result
     except Exception as e:
-        logger.error(f"Error: {e}")
+        logger.error("Error: %s", e)
         return f"❌ Error: {str(e)}"
 
 
 # === SERVER STARTUP ===
 if __name__ == "__main__":
+    # Use uvloop's faster event loop when it is installed
+    try:
+        import uvloop
+
+        uvloop.install()
+        logger.info("Using uvloop event loop")
+    except ImportError:
+        pass
+
     logger.info("Starting Sleeper Fantasy Football MCP server...")
 
     if LEAGUE_ID:
-        logger.info(f"Default league ID set to: {LEAGUE_ID}")
+        logger.info("Default league ID set to: %s", LEAGUE_ID)
     else:
         logger.info(
             "No default league ID set. Users must provide league_id parameter or set SLEEPER_LEAGUE_ID environment variable"
         )
 
     try:
-        mcp.run(transport="stdio")
+        asyncio.run(serve())
     except Exception as e:
-        logger.error(f"Server error: {e}", exc_info=True)
+        logger.error("Server error: %s", e, exc_info=True)
         sys.exit(1)